@@ -0,0 +1,71 @@
+
+import folium
+import pandas as pd
+
+# Columns that define a site's content for change detection
+HASH_COLUMNS = ["Site ID", "Status", "Installation Date", "Latitude", "Longitude"]
+# A Site ID is only unique within its project once several rollouts are loaded
+KEY_COLUMNS = ["Project", "Site ID"]
+
+
+def site_keys(df):
+    cols = [c for c in KEY_COLUMNS if c in df.columns]
+    return pd.MultiIndex.from_frame(df[cols].astype(object)) if len(cols) > 1 else pd.Index(df["Site ID"], name="Site ID")
+
+
+def describe(keys):
+    return [f"{key[1]} ({key[0]})" if isinstance(key, tuple) else key for key in keys]
+
+
+def snapshot(df):
+    # One 64-bit content hash per site, keyed by (Project, Site ID); columns are hashed in their own dtypes
+    cols = [c for c in HASH_COLUMNS if c in df.columns]
+    keys = site_keys(df)
+    first = ~keys.duplicated()
+    sites = df[first]
+    hashes = pd.util.hash_pandas_object(sites[cols], index=False)
+    return pd.DataFrame(
+        {"hash": hashes.values, "Status": sites["Status"].astype(object).values},
+        index=keys[first],
+    )
+
+
+def _in_projects(snap, projects):
+    return snap[snap.index.get_level_values("Project").isin(projects)]
+
+
+def diff_snapshots(prev, curr):
+    # Projects picked or dropped in the sidebar are not scope changes: only projects in both are compared
+    if isinstance(prev.index, pd.MultiIndex) and isinstance(curr.index, pd.MultiIndex):
+        shared = prev.index.unique("Project").intersection(curr.index.unique("Project"))
+        prev, curr = _in_projects(prev, shared), _in_projects(curr, shared)
+    joined = prev.join(curr, how="outer", lsuffix="_prev")
+    in_prev = joined["hash_prev"].notna()
+    in_curr = joined["hash"].notna()
+    changed = in_prev & in_curr & (joined["hash_prev"] != joined["hash"])
+    flipped = changed & (joined["Status_prev"] == "Open") & (joined["Status"] == "Installed")
+    changes = {
+        "added": joined.index[in_curr & ~in_prev],
+        "removed": joined.index[in_prev & ~in_curr],
+        "changed": joined.index[changed],
+        "installed": joined.index[flipped],
+    }
+    return changes if any(len(keys) for keys in changes.values()) else None
+
+
+def add_new_installs_layer(m, df, keys):
+    layer = folium.FeatureGroup(name="New since last refresh")
+    new_sites = df[site_keys(df).isin(keys)]
+    for lat, lon, site_id, date in zip(
+        new_sites["Latitude"], new_sites["Longitude"], new_sites["Site ID"], new_sites["Installation Date"]
+    ):
+        folium.CircleMarker(
+            location=[lat, lon],
+            radius=10,
+            popup=f"Site ID: {site_id}<br>Newly Installed<br>Installation Date: {date}",
+            color="blue",
+            weight=3,
+            fill=False,
+        ).add_to(layer)
+    layer.add_to(m)
+    return layer
@@ -0,0 +1,47 @@
+
+import pandas as pd
+
+from site_ids import normalize_ids
+
+project_url = "https://docs.google.com/spreadsheets/d/1pZBg_lf8HakI6o2W1v8u1lUN2FGJn1Jc/export?format=csv"
+form_url = "https://docs.google.com/spreadsheets/d/1IeZVNb01-AMRuXjj9SZQyELTVr6iw5Vq4JsiN7PdZEs/export?format=csv"
+
+
+def clean_columns(df):
+    # Sheet exports carry stray LRM marks and padding in their headers
+    df.columns = df.columns.str.replace("‎", "").str.strip()
+    return df
+
+
+def read_sheets(project_url=project_url, form_url=form_url):
+    df_sites = clean_columns(pd.read_csv(project_url))
+
+    if "Site ID" not in df_sites.columns:
+        raise KeyError("Column 'Site ID' not found in Project Sheet.")
+    df_sites["Site ID"] = normalize_ids(df_sites["Site ID"])
+
+    df_form = clean_columns(pd.read_csv(form_url))
+    df_form["Site ID"] = normalize_ids(df_form["Site ID"])
+    return df_sites, df_form
+
+
+def merge_sites(df_sites, df_form):
+    df_installed = df_form[df_form["Site ID"].isin(df_sites["Site ID"])]
+
+    df_sites = df_sites.merge(
+        df_installed[["Site ID", "Latitude", "Longitude", "Timestamp"]],
+        on="Site ID",
+        how="left",
+        suffixes=("", "_form"),
+    )
+
+    df_sites["Status"] = df_sites["Timestamp"].apply(lambda x: "Installed" if pd.notnull(x) else "Open")
+    df_sites["Latitude"] = df_sites["Latitude"].fillna(df_sites["Latitude_form"])
+    df_sites["Longitude"] = df_sites["Longitude"].fillna(df_sites["Longitude_form"])
+    df_sites["Installation Date"] = df_sites["Timestamp"].fillna("")
+
+    df_sites["Latitude"] = pd.to_numeric(df_sites["Latitude"], errors="coerce")
+    df_sites["Longitude"] = pd.to_numeric(df_sites["Longitude"], errors="coerce")
+
+    return df_sites
+
@@ -0,0 +1,49 @@
+
+import folium
+import numpy as np
+from folium.plugins import HeatMap
+
+# Fixed national extent so grids line up across refreshes
+LAT_RANGE = (16.0, 33.0)
+LON_RANGE = (34.0, 56.0)
+RESOLUTIONS = {"Coarse (~50 km)": 0.5, "Medium (~25 km)": 0.25, "Fine (~10 km)": 0.1}
+GRADIENTS = {
+    "Installed": {0.2: "#c7e9c0", 0.6: "#41ab5d", 1.0: "#00441b"},
+    "Open": {0.2: "#fcbba1", 0.6: "#ef3b2c", 1.0: "#67000d"},
+}
+
+
+def density_grids(df, resolutions=RESOLUTIONS):
+    # For each resolution and status: the non-empty cells as (lat, lon, count) rows
+    lat = df["Latitude"].to_numpy(dtype=float)
+    lon = df["Longitude"].to_numpy(dtype=float)
+    grids = {}
+    for label, step in resolutions.items():
+        lat_edges = np.arange(LAT_RANGE[0], LAT_RANGE[1] + step, step)
+        lon_edges = np.arange(LON_RANGE[0], LON_RANGE[1] + step, step)
+        lat_mid = (lat_edges[:-1] + lat_edges[1:]) / 2
+        lon_mid = (lon_edges[:-1] + lon_edges[1:]) / 2
+        grids[label] = {}
+        for status in GRADIENTS:
+            mask = (df["Status"] == status).to_numpy()
+            counts, _, _ = np.histogram2d(lat[mask], lon[mask], bins=[lat_edges, lon_edges])
+            i, j = np.nonzero(counts)
+            grids[label][status] = np.column_stack([lat_mid[i], lon_mid[j], counts[i, j]])
+    return grids
+
+
+def add_density_layers(m, grid, step):
+    # Radius in pixels roughly matching one cell at the default national zoom
+    radius = max(8, int(step * 60))
+    for status, cells in grid.items():
+        if not len(cells):
+            continue
+        layer = folium.FeatureGroup(name=f"{status} density")
+        HeatMap(
+            cells.round(4).tolist(),
+            radius=radius,
+            blur=radius,
+            gradient=GRADIENTS[status],
+        ).add_to(layer)
+        layer.add_to(m)
+    return m
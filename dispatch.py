@@ -0,0 +1,86 @@
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from regions import haversine_km
+
+SITES_PER_DAY = 6
+PLAN_DAYS = 10
+PLAN_COLUMNS = ["Crew", "Day", "Stop", "Site ID", "Latitude", "Longitude", "Leg km"]
+
+
+def to_xyz(lat, lon):
+    # Unit-sphere coordinates: chord distance is monotonic in haversine distance
+    lat, lon = np.radians(lat), np.radians(lon)
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def parse_crews(text):
+    crews = []
+    for line in text.strip().splitlines():
+        parts = [p.strip() for p in line.split(",")]
+        if len(parts) != 3:
+            raise ValueError(f"expected 'name, latitude, longitude': {line!r}")
+        crews.append((parts[0], float(parts[1]), float(parts[2])))
+    return crews
+
+
+def nearest_neighbour_tour(xyz, start, limit):
+    # Greedy tour from start over at most limit points, widening k only when neighbours are taken
+    tree = cKDTree(xyz)
+    visited = np.zeros(len(xyz), dtype=bool)
+    order = []
+    position = start
+    while len(order) < min(limit, len(xyz)):
+        k = 8
+        while True:
+            _, idx = tree.query(position, k=min(k, len(xyz)))
+            idx = np.atleast_1d(idx)
+            free = idx[~visited[idx]]
+            if len(free) or k >= len(xyz):
+                break
+            k *= 4
+        nxt = free[0]
+        visited[nxt] = True
+        order.append(nxt)
+        position = xyz[nxt]
+    return np.array(order, dtype=int)
+
+
+def plan_dispatch(df, crews, sites_per_day=SITES_PER_DAY, days=PLAN_DAYS):
+    open_sites = df[df["Status"] == "Open"].dropna(subset=["Latitude", "Longitude"])
+    if open_sites.empty or not crews:
+        return pd.DataFrame(columns=PLAN_COLUMNS)
+
+    lat = open_sites["Latitude"].to_numpy(dtype=float)
+    lon = open_sites["Longitude"].to_numpy(dtype=float)
+    xyz = to_xyz(lat, lon)
+    crew_lat = np.array([c[1] for c in crews])
+    crew_lon = np.array([c[2] for c in crews])
+    crew_xyz = to_xyz(crew_lat, crew_lon)
+
+    # Each open site belongs to its closest crew start point
+    _, owner = cKDTree(crew_xyz).query(xyz)
+    owner = np.atleast_1d(owner)
+
+    plans = []
+    for c, (name, start_lat, start_lon) in enumerate(crews):
+        mine = np.flatnonzero(owner == c)
+        if not len(mine):
+            continue
+        tour = mine[nearest_neighbour_tour(xyz[mine], crew_xyz[c], sites_per_day * days)]
+        # Legs chain across days: each day starts from the previous day's last stop
+        prev_lat = np.concatenate([[start_lat], lat[tour][:-1]])
+        prev_lon = np.concatenate([[start_lon], lon[tour][:-1]])
+        stop = np.arange(len(tour))
+        plans.append(pd.DataFrame({
+            "Crew": name,
+            "Day": stop // sites_per_day + 1,
+            "Stop": stop % sites_per_day + 1,
+            "Site ID": open_sites["Site ID"].to_numpy()[tour],
+            "Latitude": lat[tour],
+            "Longitude": lon[tour],
+            "Leg km": haversine_km(prev_lat, prev_lon, lat[tour], lon[tour]).round(1),
+        }))
+    return pd.concat(plans, ignore_index=True) if plans else pd.DataFrame(columns=PLAN_COLUMNS)
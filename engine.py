@@ -0,0 +1,149 @@
+
+from io import BytesIO
+
+import pandas as pd
+import streamlit as st
+
+from change_feed import diff_snapshots, snapshot
+from density import density_grids
+from ingest import EVENT_COLUMNS, apply_events, connect, read_events_since
+from map_payload import encode_sites
+from projects import load_all, load_registry
+from search import SiteSearchIndex
+from site_table import sort_orders
+from validation import validate
+
+# Shared data engine: every page reads the same loaded, typed site table and render caches.
+# Render caches are keyed on the data version (partition load times plus the event cursor), never on
+# the frame itself, so every page shares one object per version instead of a sampled, unpickled copy.
+CACHE_ENTRIES = 8
+
+
+@st.cache_resource
+def get_event_store():
+    return connect()
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_site_table(version, _sites, _events):
+    return typed(apply_events(_sites, _events))
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_snapshot(version, _df):
+    return snapshot(_df)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_changes(previous_version, version, _previous, _current):
+    # A reload with no content changes clears the last change set rather than re-showing it
+    if _previous["hash"].equals(_current["hash"]):
+        return None
+    return diff_snapshots(_previous, _current)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_validated(version, _df):
+    return validate(_df)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_density_grids(version, _df):
+    return density_grids(_df)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_sort_orders(version, _df):
+    return sort_orders(_df)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_search_index(version, _df):
+    return SiteSearchIndex(_df)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_map_payload(key, _df):
+    return encode_sites(_df)
+
+
+@st.cache_resource(max_entries=CACHE_ENTRIES)
+def get_excel(version, _df, dispatch_plan=None):
+    excel_buffer = BytesIO()
+    with pd.ExcelWriter(excel_buffer) as writer:
+        _df.to_excel(writer, index=False)
+        if dispatch_plan is not None and not dispatch_plan.empty:
+            dispatch_plan.to_excel(writer, sheet_name="Dispatch Plan", index=False)
+    return excel_buffer.getvalue()
+
+
+def typed(df):
+    # Low-cardinality labels as categories: smaller frames and cheaper change snapshots
+    df = df.copy()
+    for col in ["Project", "Status"]:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _load_projects():
+    projects = load_registry()
+    names = [p["name"] for p in projects]
+    selected = st.sidebar.multiselect("Projects", names, default=names)
+    refresh = {name for name in selected if st.sidebar.button(f"🔄 Refresh {name}", key=f"refresh_{name}")}
+    df, suggestions, errors, version = load_all([p for p in projects if p["name"] in selected], refresh=refresh)
+    for name, exc in errors.items():
+        st.error(f"❌ {name}: {exc.args[0] if isinstance(exc, KeyError) else exc}")
+    return df, suggestions, version
+
+
+def _read_new_events():
+    # Pick up only the submissions pushed since this session last looked
+    if "event_cursor" not in st.session_state:
+        st.session_state["event_cursor"] = 0
+        st.session_state["events"] = pd.DataFrame(columns=EVENT_COLUMNS)
+    new_events = read_events_since(get_event_store(), st.session_state["event_cursor"])
+    if not new_events.empty:
+        st.session_state["events"] = pd.concat([st.session_state["events"], new_events], ignore_index=True)
+        st.session_state["event_cursor"] = int(new_events["id"].max())
+    return st.session_state["events"], st.session_state["event_cursor"]
+
+
+def _track_changes(df, version):
+    # Diff against the previous snapshot; keep the last change set until the data version moves again.
+    # Snapshots and diffs are shared across sessions; a session only holds a reference to its last snapshot.
+    previous_version = st.session_state.get("snapshot_version")
+    if previous_version == version:
+        return st.session_state.get("changes")
+    current_snapshot = get_snapshot(version, df)
+    if previous_version is not None:
+        st.session_state["changes"] = get_changes(previous_version, version, st.session_state["snapshot"], current_snapshot)
+    st.session_state["snapshot"] = current_snapshot
+    st.session_state["snapshot_version"] = version
+    return st.session_state.get("changes")
+
+
+def prepare():
+    sites, suggestions, partitions = _load_projects()
+    if sites.empty:
+        st.warning("⚠️ No data loaded. Please check the Google Sheets links.")
+        st.stop()
+    events, cursor = _read_new_events()
+    # Events are read from id 0 in every session, so the cursor pins down their content
+    version = (partitions, cursor)
+    df = get_site_table(version, sites, events)
+    changes = _track_changes(df, version)
+    # Sites stay in the KPIs either way; only rows with a usable location are drawn
+    df_map, quarantine = get_validated(version, df)
+    st.session_state["engine"] = {
+        "version": version,
+        "df": df,
+        "df_map": df_map,
+        "quarantine": quarantine,
+        "suggestions": suggestions,
+        "changes": changes,
+    }
+
+
+def current():
+    return st.session_state["engine"]
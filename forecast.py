@@ -0,0 +1,89 @@
+
+import numpy as np
+import pandas as pd
+
+# Batched completion forecast for the whole project and every region at once
+ROLLING_DAYS = 7
+FIT_DAYS = 30
+Z = 1.96
+
+
+def daily_counts(df, today=None):
+    installed = df[df["Status"] == "Installed"]
+    dates = pd.to_datetime(installed["Installation Date"], errors="coerce").dt.normalize()
+    valid = dates.notna().to_numpy()
+    region = df["Region"].fillna("Unknown") if "Region" in df.columns else pd.Series("Unknown", index=df.index)
+    regions = pd.Index(["All"] + sorted(region.unique().tolist()))
+    if not valid.any():
+        return regions, pd.DatetimeIndex([]), np.zeros((len(regions), 0), dtype=np.int64)
+
+    dates = dates[valid]
+    start = dates.min()
+    day = (dates - start).dt.days.to_numpy()
+    # The axis runs through today, so days without installs pull the rates down
+    today = pd.Timestamp.today().normalize() if today is None else pd.Timestamp(today).normalize()
+    n_days = max(int(day.max()), (today - start).days) + 1
+    code = regions.get_indexer(region.loc[dates.index])
+
+    # One bincount over (region, day) pairs; row 0 is the project total
+    counts = np.bincount(code * n_days + day, minlength=len(regions) * n_days).reshape(len(regions), n_days)
+    counts[0] = counts[1:].sum(axis=0)
+    return regions, pd.date_range(start, periods=n_days, freq="D"), counts
+
+
+def forecast(df, rolling_days=ROLLING_DAYS, fit_days=FIT_DAYS, z=Z, today=None):
+    regions, days, counts = daily_counts(df, today)
+    region = df["Region"].fillna("Unknown") if "Region" in df.columns else pd.Series("Unknown", index=df.index)
+    scope = region.value_counts().reindex(regions, fill_value=0).to_numpy(copy=True)
+    scope[0] = len(df)
+    installed_now = (df["Status"] == "Installed").groupby(region).sum().reindex(regions, fill_value=0).to_numpy(copy=True)
+    installed_now[0] = installed_now[1:].sum()
+    remaining = scope - installed_now
+
+    result = pd.DataFrame(
+        {"Scope": scope, "Installed": installed_now, "Remaining": remaining},
+        index=pd.Index(regions, name="Region"),
+    )
+    n_days = counts.shape[1]
+    if n_days == 0:
+        result[["Rolling Rate", "Trend Rate"]] = 0.0
+        result[["ETA", "ETA Low", "ETA High"]] = pd.NaT
+        return result
+
+    cumulative = counts.cumsum(axis=1)
+    w = min(rolling_days, n_days)
+    padded = np.concatenate([np.zeros((len(regions), 1), dtype=np.int64), cumulative], axis=1)
+    result["Rolling Rate"] = (padded[:, -1] - padded[:, -1 - w]) / w
+
+    # Least-squares slope of the cumulative curve over the fit window, per row
+    f = min(fit_days, n_days)
+    y = cumulative[:, -f:].astype(float)
+    x = np.arange(f, dtype=float)
+    xc = x - x.mean()
+    sxx = (xc ** 2).sum()
+    if f > 2:
+        slope = (y - y.mean(axis=1, keepdims=True)) @ xc / sxx
+        fitted = y.mean(axis=1, keepdims=True) + slope[:, None] * xc
+        resid = ((y - fitted) ** 2).sum(axis=1)
+        se = np.sqrt(resid / (f - 2) / sxx)
+    else:
+        slope = y[:, -1] / f
+        se = np.zeros(len(regions))
+    result["Trend Rate"] = slope
+
+    last_day = days[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta = remaining / slope
+        eta_low = remaining / (slope + z * se)
+        eta_high = np.where(slope - z * se > 0, remaining / (slope - z * se), np.nan)
+    eta = np.where(slope > 0, eta, np.nan)
+    eta_low = np.where(slope + z * se > 0, eta_low, np.nan)
+
+    def to_date(offsets):
+        offsets = np.where(remaining == 0, 0, offsets)
+        return last_day + pd.to_timedelta(np.ceil(offsets), unit="D")
+
+    result["ETA"] = to_date(eta)
+    result["ETA Low"] = to_date(eta_low)
+    result["ETA High"] = to_date(eta_high)
+    return result
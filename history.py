@@ -0,0 +1,62 @@
+
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+
+from ingest import apply_events, connect, read_events_since
+from projects import load_all, load_registry
+
+# Append-only daily progress series: one row per day per project and region
+HISTORY_PATH = "progress_history.csv"
+HISTORY_COLUMNS = ["Date", "Project", "Region", "Scope", "Installed", "Open"]
+
+
+def summarize(df, day=None):
+    day = day or date.today()
+    region = df["Region"].fillna("Unknown") if "Region" in df.columns else pd.Series("Unknown", index=df.index)
+    counts = pd.crosstab([df["Project"].astype(object), region.rename("Region")], df["Status"])
+    counts = counts.reindex(columns=["Installed", "Open"], fill_value=0)
+    summary = counts.reset_index()
+    summary.columns = ["Project", "Region", "Installed", "Open"]
+    summary["Scope"] = summary["Installed"] + summary["Open"]
+    summary["Date"] = pd.Timestamp(day).date().isoformat()
+    return summary[HISTORY_COLUMNS]
+
+
+def append_snapshot(df, path=HISTORY_PATH, day=None):
+    summary = summarize(df, day)
+    if os.path.exists(path):
+        # A project's day is written once; re-running the job the same day only adds projects not yet recorded
+        recorded = pd.read_csv(path, usecols=["Date", "Project"], dtype={"Project": str})
+        done = recorded.loc[recorded["Date"] == summary["Date"].iloc[0], "Project"]
+        summary = summary[~summary["Project"].isin(done)]
+        if summary.empty:
+            return 0
+        summary.to_csv(path, mode="a", header=False, index=False)
+    else:
+        summary.to_csv(path, index=False)
+    return len(summary)
+
+
+def load_history(path=HISTORY_PATH, region=None, projects=None):
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+    history = pd.read_csv(path, parse_dates=["Date"], dtype={"Project": str})
+    if projects is not None:
+        history = history[history["Project"].isin(projects)]
+    if region is not None:
+        history = history[history["Region"] == region]
+    return history.groupby("Date")[["Scope", "Installed", "Open"]].sum().sort_index()
+
+
+if __name__ == "__main__":
+    sites, _, errors, _ = load_all(load_registry())
+    for name, exc in errors.items():
+        print(f"Skipping {name}: {exc}")
+    if sites.empty:
+        sys.exit("No project data loaded; nothing recorded")
+    df = apply_events(sites, read_events_since(connect()))
+    written = append_snapshot(df, *sys.argv[1:2])
+    print(f"Wrote {written} history rows" if written else "Today's snapshot is already recorded")
@@ -0,0 +1,184 @@
+
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import numpy as np
+import pandas as pd
+
+from site_ids import MISSING_IDS, normalize_site_id
+
+# Local store for form submissions pushed to the ingestion service
+DB_PATH = "installations.db"
+HOST = "127.0.0.1"
+PORT = 8502
+
+EVENT_COLUMNS = ["id", "Project", "Site ID", "Latitude", "Longitude", "Timestamp", "Received"]
+
+
+def connect(db_path=DB_PATH):
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            site_id TEXT NOT NULL,
+            latitude REAL,
+            longitude REAL,
+            timestamp TEXT,
+            received TEXT NOT NULL
+        )
+        """
+    )
+    # Stores created before submissions carried a project get the column added
+    if "project" not in {row[1] for row in conn.execute("PRAGMA table_info(events)")}:
+        conn.execute("ALTER TABLE events ADD COLUMN project TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_events_site_id ON events (site_id)")
+    return conn
+
+
+def _to_float(value):
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid coordinate: {value!r}")
+
+
+def format_timestamp(value):
+    # Same M/D/YYYY HH:MM:SS layout as the Google Form sheet, so one column parses as one format
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"invalid timestamp: {value!r}")
+    ts = pd.Timestamp.now() if value is None or value == "" else pd.to_datetime(value, errors="coerce")
+    if pd.isna(ts):
+        raise ValueError(f"invalid timestamp: {value!r}")
+    return f"{ts.month}/{ts.day}/{ts.year} {ts:%H:%M:%S}"
+
+
+def validate_submission(payload):
+    if not isinstance(payload, dict):
+        raise ValueError("submission must be a JSON object")
+    raw_id = payload.get("Site ID") or ""
+    # JSON lists, objects, floats and booleans are not IDs (and lists/objects cannot be memoized)
+    if isinstance(raw_id, bool) or not isinstance(raw_id, (str, int)):
+        raise ValueError(f"invalid 'Site ID': {raw_id!r}")
+    site_id = normalize_site_id(raw_id)
+    if site_id in MISSING_IDS:
+        raise ValueError("'Site ID' is required")
+    project = payload.get("Project") or ""
+    if not isinstance(project, str):
+        raise ValueError(f"invalid 'Project': {project!r}")
+    project = project.strip()
+    return {
+        "project": project or None,
+        "site_id": site_id,
+        "latitude": _to_float(payload.get("Latitude")),
+        "longitude": _to_float(payload.get("Longitude")),
+        "timestamp": format_timestamp(payload.get("Timestamp")),
+    }
+
+
+def append_event(conn, payload):
+    event = validate_submission(payload)
+    cur = conn.execute(
+        "INSERT INTO events (project, site_id, latitude, longitude, timestamp, received) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            event["project"],
+            event["site_id"],
+            event["latitude"],
+            event["longitude"],
+            event["timestamp"],
+            datetime.now().isoformat(timespec="seconds"),
+        ),
+    )
+    conn.commit()
+    return cur.lastrowid
+
+
+def read_events_since(conn, last_id=0):
+    # Only rows appended after the caller's cursor are read back
+    rows = conn.execute(
+        "SELECT id, project, site_id, latitude, longitude, timestamp, received FROM events WHERE id > ? ORDER BY id",
+        (last_id,),
+    ).fetchall()
+    return pd.DataFrame(rows, columns=EVENT_COLUMNS)
+
+
+def _keyed_events(df_sites, events):
+    # First event per site, keyed the way the site table is keyed
+    if "Project" not in df_sites.columns:
+        return events.drop_duplicates(subset="Site ID", keep="first").set_index("Site ID"), ["Site ID"]
+    # An event that names no project only applies to a Site ID owned by exactly one loaded project
+    owners = df_sites.drop_duplicates(subset=["Project", "Site ID"]).astype({"Project": object})
+    unique_owner = owners.drop_duplicates(subset="Site ID", keep=False).set_index("Site ID")["Project"]
+    unnamed = events["Project"].isna()
+    events = events.assign(Project=events["Project"].where(~unnamed, events["Site ID"].map(unique_owner)))
+    events = events.dropna(subset=["Project"])
+    first_events = events.drop_duplicates(subset=["Project", "Site ID"], keep="first")
+    return first_events.set_index(["Project", "Site ID"]), ["Project", "Site ID"]
+
+
+def apply_events(df_sites, events):
+    # Mark project sites that have a pushed submission as installed
+    if events.empty or df_sites.empty:
+        return df_sites
+    first_events, keys = _keyed_events(df_sites, events)
+    df = df_sites.copy()
+    row_keys = pd.MultiIndex.from_frame(df[keys].astype(object)) if len(keys) > 1 else pd.Index(df["Site ID"])
+    pos = first_events.index.get_indexer(row_keys)
+    matched = pos >= 0
+    hit = matched & (df["Status"] != "Installed").to_numpy()
+    df.loc[hit, "Status"] = "Installed"
+    df.loc[hit, "Installation Date"] = first_events["Timestamp"].to_numpy()[pos[hit]]
+    # Pushed coordinates fill sites the project sheet left blank, as the CSV merge does
+    for col in ["Latitude", "Longitude"]:
+        pushed = pd.to_numeric(first_events[col], errors="coerce").to_numpy()
+        df[col] = df[col].fillna(pd.Series(np.where(matched, pushed[pos], np.nan), index=df.index))
+    return df
+
+
+class IngestHandler(BaseHTTPRequestHandler):
+    conn = None
+
+    def _reply(self, code, body):
+        data = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        if self.path != "/submit":
+            self._reply(404, {"error": "not found"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            event_id = append_event(self.conn, payload)
+        except (ValueError, json.JSONDecodeError) as exc:
+            self._reply(400, {"error": str(exc)})
+            return
+        self._reply(201, {"id": event_id})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(db_path=DB_PATH, host=HOST, port=PORT):
+    IngestHandler.conn = connect(db_path)
+    server = HTTPServer((host, port), IngestHandler)
+    print(f"Ingestion service listening on http://{host}:{port}/submit (store: {db_path})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    serve(*sys.argv[1:2])
@@ -0,0 +1,36 @@
+
+import json
+import sys
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pandas as pd
+
+from data import clean_columns
+from ingest import HOST, PORT
+
+# Local stub: replays a form-response CSV export as a stream of posts
+form_url = "https://docs.google.com/spreadsheets/d/1IeZVNb01-AMRuXjj9SZQyELTVr6iw5Vq4JsiN7PdZEs/export?format=csv"
+
+
+def replay(source=form_url, endpoint=f"http://{HOST}:{PORT}/submit", delay=0.0):
+    df_form = clean_columns(pd.read_csv(source))
+    sent, rejected = 0, 0
+    columns = [c for c in ["Project", "Site ID", "Latitude", "Longitude", "Timestamp"] if c in df_form.columns]
+    for record in df_form[columns].to_dict("records"):
+        record = {k: (None if pd.isna(v) else v) for k, v in record.items()}
+        req = Request(endpoint, data=json.dumps(record, default=str).encode(), headers={"Content-Type": "application/json"})
+        try:
+            urlopen(req).close()
+            sent += 1
+        except HTTPError as exc:
+            rejected += 1
+            print(f"rejected {record.get('Site ID')}: {exc.read().decode()}")
+        if delay:
+            time.sleep(delay)
+    print(f"Replayed {sent} submissions ({rejected} rejected)")
+
+
+if __name__ == "__main__":
+    replay(*sys.argv[1:2], delay=float(sys.argv[2]) if len(sys.argv) > 2 else 0.0)
@@ -0,0 +1,106 @@
+
+import gzip
+import json
+
+import folium
+import numpy as np
+import pandas as pd
+from branca.element import MacroElement
+from jinja2 import Template
+
+# 1e-5 degrees is about 1.1 m of latitude
+SCALE = 100000
+STATUS_CODES = ["Open", "Installed"]
+STATUS_COLORS = ["red", "green"]
+MAP_CENTER = [23.8859, 45.0792]
+
+
+def add_markers(m, df):
+    # One inline popup per marker, as the dashboards have always rendered it
+    for _, row in df.iterrows():
+        color = "green" if row["Status"] == "Installed" else "red"
+        folium.CircleMarker(
+            location=[row["Latitude"], row["Longitude"]],
+            radius=6,
+            popup=f"Site ID: {row['Site ID']}<br>Status: {row['Status']}<br>Installation Date: {row['Installation Date']}",
+            color=color,
+            fill=True,
+            fill_color=color,
+            fill_opacity=0.8,
+        ).add_to(m)
+    return m
+
+
+def encode_sites(df):
+    lat = np.round(df["Latitude"].to_numpy(dtype=float) * SCALE).astype(np.int64)
+    lon = np.round(df["Longitude"].to_numpy(dtype=float) * SCALE).astype(np.int64)
+    # Sorting by latitude keeps the deltas small and repetitive, which gzip compresses well
+    order = np.lexsort((lon, lat))
+    lat, lon = lat[order], lon[order]
+    status = pd.Categorical(df["Status"].to_numpy()[order], categories=STATUS_CODES).codes
+    dates, date_codes = np.unique(df["Installation Date"].fillna("").astype(str).to_numpy()[order], return_inverse=True)
+    return {
+        "scale": SCALE,
+        "lat": np.diff(lat, prepend=0).tolist(),
+        "lon": np.diff(lon, prepend=0).tolist(),
+        "id": df["Site ID"].astype(str).to_numpy()[order].tolist(),
+        "status": status.tolist(),
+        "date": date_codes.tolist(),
+        "dates": dates.tolist(),
+    }
+
+
+def script_json(obj):
+    # JSON that cannot close the surrounding <script> block or open an HTML entity
+    text = json.dumps(obj, separators=(",", ":"))
+    return text.replace("&", "\\u0026").replace("<", "\\u003c").replace(">", "\\u003e")
+
+
+class CompactMarkers(MacroElement):
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            (function() {
+                var d = {{ this.payload }};
+                var map = {{ this._parent.get_name() }};
+                var statuses = {{ this.statuses }}, colors = {{ this.colors }};
+                var renderer = L.canvas();
+                var esc = function(s) { var e = document.createElement("span"); e.textContent = s; return e.innerHTML; };
+                var lat = 0, lon = 0;
+                for (var i = 0; i < d.id.length; i++) {
+                    lat += d.lat[i]; lon += d.lon[i];
+                    var c = colors[d.status[i]] || "red";
+                    var marker = L.circleMarker([lat / d.scale, lon / d.scale], {
+                        renderer: renderer, radius: 6, color: c, fillColor: c, fill: true, fillOpacity: 0.8
+                    }).addTo(map);
+                    marker.site = i;
+                    // Popup HTML is only built when a marker is clicked
+                    marker.on("click", function(e) {
+                        var j = e.target.site;
+                        e.target.bindPopup("Site ID: " + esc(d.id[j]) + "<br>Status: " + (statuses[d.status[j]] || "Open")
+                            + "<br>Installation Date: " + esc(d.dates[d.date[j]])).openPopup();
+                    });
+                }
+            })();
+        {% endmacro %}
+        """
+    )
+
+    def __init__(self, df=None, payload=None):
+        super().__init__()
+        self._name = "CompactMarkers"
+        self.payload = script_json(payload if payload is not None else encode_sites(df))
+        self.statuses = script_json(STATUS_CODES)
+        self.colors = script_json(STATUS_COLORS)
+
+
+def payload_report(df):
+    rows = []
+    for mode, build in [("Inline popups", add_markers), ("Compact", lambda m, d: CompactMarkers(d).add_to(m))]:
+        m = folium.Map(location=MAP_CENTER, zoom_start=6)
+        build(m, df)
+        html = m.get_root().render().encode()
+        rows.append({"Mode": mode, "HTML bytes": len(html), "Gzipped bytes": len(gzip.compress(html))})
+    report = pd.DataFrame(rows).set_index("Mode")
+    report["Reduction %"] = (100 * (1 - report["HTML bytes"] / report["HTML bytes"].iloc[0])).round(1)
+    return report
@@ -0,0 +1,113 @@
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from data import form_url, merge_sites, project_url, read_sheets
+from regions import assign_regions
+from site_ids import suggest_matches
+
+# Optional registry file: a JSON list of {"name", "project_url", "form_url"} entries
+REGISTRY_PATH = "projects.json"
+PROJECTS = [
+    {"name": "ODC-AC", "project_url": project_url, "form_url": form_url},
+]
+MAX_WORKERS = 8
+
+# Process-wide cache, one partition per project, plus the fetches currently running
+_partitions = {}
+_inflight = {}
+_lock = threading.Lock()
+_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+
+def load_registry(path=REGISTRY_PATH):
+    if not os.path.exists(path):
+        return PROJECTS
+    with open(path, encoding="utf-8") as fh:
+        projects = json.load(fh)
+    for project in projects:
+        missing = {"name", "project_url", "form_url"} - set(project)
+        if missing:
+            raise ValueError(f"project entry {project.get('name', '?')!r} is missing {sorted(missing)}")
+    return projects
+
+
+def load_project(project):
+    df_sites, df_form = read_sheets(project["project_url"], project["form_url"])
+    sites = assign_regions(merge_sites(df_sites, df_form))
+    sites.insert(0, "Project", project["name"])
+    suggestions = suggest_matches(df_form["Site ID"], df_sites["Site ID"])
+    suggestions.insert(0, "Project", project["name"])
+    return sites, suggestions
+
+
+def _source(project):
+    return project["project_url"], project["form_url"]
+
+
+def _is_stale(project):
+    cached = _partitions.get(project["name"])
+    return cached is None or cached["source"] != _source(project)
+
+
+def _fetch(project, key):
+    # Runs on the shared pool without the lock, so a slow sheet never blocks other sessions
+    try:
+        sites, suggestions = load_project(project)
+        with _lock:
+            _partitions[project["name"]] = {
+                "loaded": time.time(),
+                "source": _source(project),
+                "sites": sites,
+                "suggestions": suggestions,
+            }
+    finally:
+        with _lock:
+            _inflight.pop(key, None)
+
+
+def load_all(projects, refresh=()):
+    # Only missing or explicitly refreshed partitions are fetched, concurrently, and once per process:
+    # a session that finds a fetch already running waits on it instead of downloading again.
+    # The returned version, (name, load time) per partition, changes whenever any partition is reloaded.
+    pending = {}
+    with _lock:
+        for project in projects:
+            key = (project["name"], _source(project))
+            if key in _inflight:
+                pending[project["name"]] = _inflight[key]
+            elif project["name"] in refresh or _is_stale(project):
+                pending[project["name"]] = _inflight[key] = _pool.submit(_fetch, project, key)
+
+    errors = {}
+    for name, future in pending.items():
+        exc = future.exception()
+        if isinstance(exc, (KeyError, OSError, ValueError, pd.errors.ParserError)):
+            errors[name] = exc
+        elif exc is not None:
+            raise exc
+
+    with _lock:
+        loaded = [(p["name"], _partitions[p["name"]]) for p in projects if p["name"] in _partitions]
+
+    if not loaded:
+        return pd.DataFrame(), pd.DataFrame(), errors, ()
+    version = tuple((name, part["loaded"]) for name, part in loaded)
+    sites = pd.concat([part["sites"] for _, part in loaded], ignore_index=True)
+    suggestions = pd.concat([part["suggestions"] for _, part in loaded], ignore_index=True)
+    return sites, suggestions, errors, version
+
+
+
+
+def project_kpis(df):
+    kpis = df.groupby("Project")["Status"].value_counts().unstack(fill_value=0)
+    kpis = kpis.reindex(columns=["Installed", "Open"], fill_value=0)
+    kpis.insert(0, "Total Sites", kpis["Installed"] + kpis["Open"])
+    kpis["Progress %"] = (100 * kpis["Installed"] / kpis["Total Sites"]).round(2)
+    return kpis
@@ -0,0 +1,153 @@
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Bundled boundary file (see boundaries/NOTICE): GeoJSON features with a "name" property per region
+BOUNDARIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "boundaries", "regions.geojson")
+EARTH_RADIUS_KM = 6371.0
+CITY_RADIUS_KM = 40.0
+
+# Seats of the 13 administrative regions; nearest seat labels points outside every polygon
+REGION_SEATS = {
+    "Riyadh": (24.7136, 46.6753),
+    "Makkah": (21.3891, 39.8579),
+    "Madinah": (24.5247, 39.5692),
+    "Eastern Province": (26.4207, 50.0888),
+    "Qassim": (26.3592, 43.9818),
+    "Asir": (18.2164, 42.5053),
+    "Tabuk": (28.3838, 36.5550),
+    "Hail": (27.5114, 41.7208),
+    "Northern Borders": (30.9753, 41.0381),
+    "Jazan": (16.8892, 42.5511),
+    "Najran": (17.5656, 44.2289),
+    "Al Bahah": (20.0129, 41.4677),
+    "Al Jawf": (29.9697, 40.2064),
+}
+
+# Major cities with the region they belong to
+CITIES = {
+    "Riyadh": (24.7136, 46.6753, "Riyadh"),
+    "Al Kharj": (24.1556, 47.3120, "Riyadh"),
+    "Jeddah": (21.4858, 39.1925, "Makkah"),
+    "Makkah": (21.3891, 39.8579, "Makkah"),
+    "Taif": (21.2703, 40.4158, "Makkah"),
+    "Madinah": (24.5247, 39.5692, "Madinah"),
+    "Yanbu": (24.0895, 38.0618, "Madinah"),
+    "Dammam": (26.4207, 50.0888, "Eastern Province"),
+    "Khobar": (26.2172, 50.1971, "Eastern Province"),
+    "Dhahran": (26.2361, 50.0393, "Eastern Province"),
+    "Jubail": (27.0046, 49.6460, "Eastern Province"),
+    "Al Ahsa": (25.3833, 49.5861, "Eastern Province"),
+    "Hafar Al Batin": (28.4328, 45.9708, "Eastern Province"),
+    "Buraydah": (26.3592, 43.9818, "Qassim"),
+    "Unaizah": (26.0843, 43.9935, "Qassim"),
+    "Abha": (18.2164, 42.5053, "Asir"),
+    "Khamis Mushait": (18.3000, 42.7333, "Asir"),
+    "Tabuk": (28.3838, 36.5550, "Tabuk"),
+    "Hail": (27.5114, 41.7208, "Hail"),
+    "Arar": (30.9753, 41.0381, "Northern Borders"),
+    "Jazan": (16.8892, 42.5511, "Jazan"),
+    "Najran": (17.5656, 44.2289, "Najran"),
+    "Al Bahah": (20.0129, 41.4677, "Al Bahah"),
+    "Sakaka": (29.9697, 40.2064, "Al Jawf"),
+}
+
+_cache = {}
+
+
+def load_boundaries(path=BOUNDARIES_PATH):
+    # Returns (name, ring array [lon, lat], bbox) for each outer ring
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as fh:
+        features = json.load(fh)["features"]
+    rings = []
+    for feature in features:
+        name = feature["properties"]["name"]
+        geometry = feature["geometry"]
+        polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+        for polygon in polygons:
+            ring = np.asarray(polygon[0], dtype=float)
+            rings.append((name, ring, (ring[:, 0].min(), ring[:, 1].min(), ring[:, 0].max(), ring[:, 1].max())))
+    return rings
+
+
+_boundaries = load_boundaries()
+
+
+def points_in_ring(lon, lat, ring):
+    # Even-odd ray casting, vectorized over points, looping over edges only
+    inside = np.zeros(len(lon), dtype=bool)
+    x1, y1 = ring[:-1, 0], ring[:-1, 1]
+    x2, y2 = ring[1:, 0], ring[1:, 1]
+    for ax, ay, bx, by in zip(x1, y1, x2, y2):
+        crosses = (ay > lat) != (by > lat)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = ax + (lat - ay) * (bx - ax) / (by - ay)
+        inside ^= crosses & (lon < x_cross)
+    return inside
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def _nearest(lat, lon, places):
+    names = np.array(list(places), dtype=object)
+    coords = np.array([place[:2] for place in places.values()])
+    dist = haversine_km(lat[:, None], lon[:, None], coords[None, :, 0], coords[None, :, 1])
+    best = dist.argmin(axis=1)
+    return names[best], dist[np.arange(len(lat)), best]
+
+
+def locate(lat, lon, boundaries=None):
+    boundaries = _boundaries if boundaries is None else boundaries
+    region = np.full(len(lat), None, dtype=object)
+    for name, ring, (min_lon, min_lat, max_lon, max_lat) in boundaries:
+        # Bounding-box prefilter before the exact test
+        candidates = np.flatnonzero(
+            (region == None) & (lon >= min_lon) & (lon <= max_lon) & (lat >= min_lat) & (lat <= max_lat)  # noqa: E711
+        )
+        if len(candidates):
+            hit = points_in_ring(lon[candidates], lat[candidates], ring)
+            region[candidates[hit]] = name
+    missing = region == None  # noqa: E711
+    if missing.any():
+        region[missing] = _nearest(lat[missing], lon[missing], REGION_SEATS)[0]
+    city, city_km = _nearest(lat, lon, CITIES)
+    city_region = np.array([CITIES[name][2] for name in city], dtype=object)
+    # A city is only reported when it is close and lies in the same region as the point
+    city[(city_km > CITY_RADIUS_KM) | (city_region != region)] = ""
+    return region, city
+
+
+def assign_regions(df):
+    lat = pd.to_numeric(df["Latitude"], errors="coerce").round(5)
+    lon = pd.to_numeric(df["Longitude"], errors="coerce").round(5)
+    valid = (lat.notna() & lon.notna()).to_numpy()
+    keys = pd.MultiIndex.from_arrays([lat[valid], lon[valid]]).unique()
+
+    # Only coordinates not seen before are labelled; the rest come from the cache
+    misses = [key for key in keys if key not in _cache]
+    if misses:
+        coords = np.array(misses, dtype=float)
+        region, city = locate(coords[:, 0], coords[:, 1])
+        _cache.update(zip(misses, zip(region, city)))
+
+    labels = pd.Series([_cache[key] for key in zip(lat[valid], lon[valid])], index=df.index[valid], dtype=object)
+    df = df.copy()
+    geo_region = labels.str[0].reindex(df.index)
+    geo_city = labels.str[1].reindex(df.index)
+    if "Region" in df.columns:
+        blank = df["Region"].isna() | (df["Region"].astype(str).str.strip() == "")
+        df["Region"] = df["Region"].where(~blank, geo_region)
+    else:
+        df["Region"] = geo_region
+    if "City" not in df.columns:
+        df["City"] = geo_city
+    return df
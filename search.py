@@ -0,0 +1,35 @@
+
+import numpy as np
+
+from site_ids import normalize_ids
+
+SEARCH_COLUMNS = ["Site ID", "Site Name"]
+MAX_MATCHES = 20
+
+
+class SiteSearchIndex:
+    # Sorted normalized keys; a prefix maps to one contiguous slice found with searchsorted
+    def __init__(self, df):
+        keys, rows = [], []
+        for col in SEARCH_COLUMNS:
+            if col in df.columns:
+                # Missing IDs/names get no key, so they cannot match a typed "NAN"
+                present = df[col].notna().to_numpy() & (df[col].astype(str).str.strip() != "").to_numpy()
+                keys.append(normalize_ids(df[col][present]).to_numpy(dtype=str))
+                rows.append(np.flatnonzero(present))
+        keys = np.concatenate(keys) if keys else np.array([], dtype=str)
+        rows = np.concatenate(rows) if rows else np.array([], dtype=int)
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.rows = rows[order]
+
+    def lookup(self, prefix, limit=MAX_MATCHES):
+        prefix = prefix.strip().upper()
+        if not prefix:
+            return np.array([], dtype=int)
+        lo = np.searchsorted(self.keys, prefix, side="left")
+        hi = np.searchsorted(self.keys, prefix + "\U0010ffff", side="left")
+        # A site can match on both ID and name, so this window still holds `limit` distinct rows
+        rows = self.rows[lo:min(hi, lo + limit * len(SEARCH_COLUMNS))]
+        _, first = np.unique(rows, return_index=True)
+        return rows[np.sort(first)][:limit]
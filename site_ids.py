@@ -0,0 +1,90 @@
+
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Invisible marks that show up in pasted Site IDs (LRM, RLM, zero-width space, BOM)
+HIDDEN_MARKS = str.maketrans("", "", "‎‏​﻿")
+# Look-alike characters folded together when suggesting matches
+CONFUSABLES = str.maketrans({"O": "0", "I": "1", "L": "1", "S": "5", "B": "8", "Z": "2"})
+# What blank and missing cells normalize to
+MISSING_IDS = {"", "NAN"}
+Q = 2
+MIN_SCORE = 0.8
+# Bounded: the ingest service feeds it whatever clients send
+CACHE_SIZE = 2**16
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_site_id(value):
+    return str(value).translate(HIDDEN_MARKS).strip().upper()
+
+
+def normalize_ids(values):
+    # Normalize each distinct ID once and broadcast back through the factorized codes
+    values = pd.Series(values)
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    normalized = np.array([normalize_site_id(u) for u in uniques], dtype=object)
+    return pd.Series(normalized[codes], index=values.index)
+
+
+def skeleton(site_id):
+    return site_id.translate(CONFUSABLES).replace("-", "").replace("_", "").replace(" ", "")
+
+
+def _qgrams(text, q=Q):
+    padded = f"#{text}#"
+    return {padded[i:i + q] for i in range(len(padded) - q + 1)}
+
+
+class SiteIdIndex:
+    def __init__(self, site_ids, q=Q):
+        self.q = q
+        self.ids = np.array(sorted(set(site_ids)), dtype=object)
+        self.skeletons = [skeleton(s) for s in self.ids]
+        postings = {}
+        for i, sk in enumerate(self.skeletons):
+            for gram in _qgrams(sk, q):
+                postings.setdefault(gram, []).append(i)
+        self.postings = {gram: np.array(ix) for gram, ix in postings.items()}
+
+    def suggest(self, site_id, limit=5, min_score=MIN_SCORE):
+        sk = skeleton(site_id)
+        hits = [self.postings[g] for g in _qgrams(sk, self.q) if g in self.postings]
+        if not hits:
+            return []
+        # Shortlist by shared q-grams, then score only the shortlist
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.ids))
+        top = np.argpartition(-shared, min(limit, len(shared)) - 1)[:limit]
+        shortlist = top[np.argsort(-shared[top], kind="stable")]
+        scored = []
+        for i in shortlist:
+            if shared[i] == 0:
+                break
+            score = SequenceMatcher(None, sk, self.skeletons[i]).ratio()
+            if score >= min_score:
+                scored.append((self.ids[i], round(score, 3)))
+        return sorted(scored, key=lambda pair: -pair[1])
+
+
+def suggest_matches(form_ids, project_ids, min_score=MIN_SCORE):
+    project_ids = pd.unique(pd.Series(project_ids))
+    form_ids = pd.Series(form_ids)
+    # Submissions with no Site ID have nothing to match
+    form_ids = form_ids[form_ids.notna() & ~form_ids.isin(MISSING_IDS)]
+    unmatched = pd.unique(form_ids[~form_ids.isin(project_ids)])
+    rows = []
+    if len(unmatched):
+        index = SiteIdIndex(project_ids)
+        for site_id in unmatched:
+            matches = index.suggest(site_id, min_score=min_score)
+            # Candidates tied on the best score are all listed rather than picking one arbitrarily
+            best = [match for match, score in matches if score == matches[0][1]]
+            rows.append({
+                "Form Site ID": site_id,
+                "Suggested Site ID": ", ".join(best),
+                "Score": matches[0][1] if matches else 0.0,
+            })
+    return pd.DataFrame(rows, columns=["Form Site ID", "Suggested Site ID", "Score"])
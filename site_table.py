@@ -0,0 +1,56 @@
+
+import numpy as np
+import pandas as pd
+
+TABLE_COLUMNS = ["Project", "Site ID", "Region", "City", "Status", "Installation Date", "Latitude", "Longitude"]
+FILTER_COLUMNS = ["Project", "Region", "Status"]
+# Raw form timestamps: sorted by parsed time, not as text
+DATE_COLUMNS = ["Installation Date"]
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def table_columns(df):
+    return [c for c in TABLE_COLUMNS if c in df.columns]
+
+
+def sort_orders(df, columns=None):
+    # One stable argsort per column, computed once per data version; missing values sort last
+    orders = {}
+    for col in columns or table_columns(df):
+        values = df[col]
+        if col in DATE_COLUMNS:
+            values = pd.to_datetime(values, errors="coerce")
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_datetime64_any_dtype(values):
+            missing = values.isna().to_numpy()
+            key = values.to_numpy()
+        else:
+            key = pd.factorize(values.astype(str).where(values.notna()), sort=True)[0]
+            missing = key < 0
+            key = np.where(missing, key.max() + 1, key)
+        # (order, number of non-missing rows at the front of it)
+        orders[col] = (np.argsort(key, kind="stable"), int((~missing).sum()))
+    return orders
+
+
+def filter_mask(df, filters=None, search=""):
+    mask = np.ones(len(df), dtype=bool)
+    for col, allowed in (filters or {}).items():
+        if allowed:
+            mask &= df[col].isin(allowed).to_numpy()
+    if search:
+        mask &= df["Site ID"].str.contains(search.strip().upper(), regex=False, na=False).to_numpy()
+    return mask
+
+
+def get_page(df, orders, sort_by, ascending=True, mask=None, page=1, page_size=PAGE_SIZES[0]):
+    order, present = orders[sort_by]
+    if not ascending:
+        # Reverse only the non-missing part so blanks stay at the end
+        order = np.concatenate([order[:present][::-1], order[present:]])
+    if mask is not None:
+        order = order[mask[order]]
+    total = len(order)
+    start = (page - 1) * page_size
+    # Only the requested slice is materialized
+    rows = df.iloc[order[start:start + page_size]][table_columns(df)]
+    return rows, total
@@ -0,0 +1,65 @@
+
+import numpy as np
+import pandas as pd
+
+from regions import haversine_km
+
+# Generous envelope around the Kingdom's land and coastal waters
+LAT_RANGE = (16.0, 32.5)
+LON_RANGE = (34.0, 56.0)
+FORM_DISTANCE_KM = 2.0
+QUARANTINE_COLUMNS = ["Project", "Site ID", "Latitude", "Longitude", "Issues", "On Map"]
+
+
+def _in_bounds(lat, lon):
+    return (lat >= LAT_RANGE[0]) & (lat <= LAT_RANGE[1]) & (lon >= LON_RANGE[0]) & (lon <= LON_RANGE[1])
+
+
+def check_coordinates(df):
+    # One boolean column per check; every check is a whole-column mask
+    lat = pd.to_numeric(df["Latitude"], errors="coerce").to_numpy(dtype=float)
+    lon = pd.to_numeric(df["Longitude"], errors="coerce").to_numpy(dtype=float)
+    missing = np.isnan(lat) | np.isnan(lon)
+    zero = ~missing & ((lat == 0) | (lon == 0))
+    inside = _in_bounds(lat, lon)
+    swapped = ~missing & ~zero & ~inside & _in_bounds(lon, lat)
+    outside = ~missing & ~zero & ~inside & ~swapped
+
+    coords = pd.DataFrame({"lat": np.round(lat, 5), "lon": np.round(lon, 5), "id": df["Site ID"].to_numpy()})
+    # Same point shared by more than one distinct Site ID
+    distinct = coords[~missing].drop_duplicates()
+    shared = distinct[distinct.duplicated(["lat", "lon"], keep=False)]
+    point = pd.MultiIndex.from_frame(coords[["lat", "lon"]])
+    duplicate = ~missing & point.isin(pd.MultiIndex.from_frame(shared[["lat", "lon"]]))
+
+    far_from_form = np.zeros(len(df), dtype=bool)
+    if "Latitude_form" in df.columns and "Longitude_form" in df.columns:
+        form_lat = pd.to_numeric(df["Latitude_form"], errors="coerce").to_numpy(dtype=float)
+        form_lon = pd.to_numeric(df["Longitude_form"], errors="coerce").to_numpy(dtype=float)
+        with np.errstate(invalid="ignore"):
+            far_from_form = haversine_km(lat, lon, form_lat, form_lon) > FORM_DISTANCE_KM
+
+    return pd.DataFrame({
+        "missing coordinates": missing,
+        "zero coordinate": zero,
+        "lat/lon swapped": swapped,
+        "outside Kingdom": outside,
+        "duplicate coordinates": duplicate,
+        f"form location > {FORM_DISTANCE_KM:g} km away": far_from_form,
+    }, index=df.index)
+
+
+def validate(df):
+    # Returns (rows that can be drawn on the map, quarantine table)
+    checks = check_coordinates(df)
+    on_map = ~checks[["missing coordinates", "zero coordinate", "lat/lon swapped", "outside Kingdom"]].any(axis=1)
+    flagged = checks.any(axis=1)
+
+    # Pack the flags into one integer per row and spell out each distinct combination once
+    bits = checks.to_numpy() @ (1 << np.arange(checks.shape[1]))
+    codes, inverse = np.unique(bits[flagged.to_numpy()], return_inverse=True)
+    labels = np.array(["; ".join(checks.columns[(code >> np.arange(checks.shape[1])) & 1 == 1]) for code in codes], dtype=object)
+
+    quarantine = df.loc[flagged].assign(Issues=labels[inverse], **{"On Map": on_map[flagged]})
+    quarantine = quarantine[[c for c in QUARANTINE_COLUMNS if c in quarantine.columns]]
+    return df.loc[on_map], quarantine
@@ -0,0 +1,26 @@
+import pandas as pd
+import streamlit as st
+
+from dispatch import parse_crews, plan_dispatch
+from engine import current, get_excel
+
+data = current()
+df_map = data["df_map"]
+
+st.subheader("🚚 Crew Dispatch Plan")
+crews_text = st.text_area("Crew start points (name, latitude, longitude per line)", "Crew 1, 24.7136, 46.6753")
+dp1, dp2 = st.columns(2)
+sites_per_day = dp1.number_input("Sites per crew per day", min_value=1, value=6)
+plan_days = dp2.number_input("Days to plan", min_value=1, value=10)
+try:
+    dispatch_plan = plan_dispatch(df_map, parse_crews(crews_text), int(sites_per_day), int(plan_days))
+except ValueError as exc:
+    st.error(f"❌ {exc}")
+    dispatch_plan = pd.DataFrame()
+# Kept for the Overview export, which adds it as a second sheet
+st.session_state["dispatch_plan"] = dispatch_plan
+st.dataframe(dispatch_plan, hide_index=True)
+
+if not dispatch_plan.empty:
+    excel_data = get_excel(data["version"], data["df"], dispatch_plan)
+    st.download_button("⬇️ Download Excel with Dispatch Plan", data=excel_data, file_name="installation_status.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
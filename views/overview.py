@@ -0,0 +1,86 @@
+import base64
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+
+from engine import current, get_excel
+from forecast import forecast
+from history import load_history
+from projects import project_kpis
+
+data = current()
+df = data["df"]
+
+total_sites = len(df)
+installed_count = (df["Status"] == "Installed").sum()
+open_count = (df["Status"] == "Open").sum()
+progress = round((installed_count / total_sites) * 100, 2) if total_sites else 0
+
+installed_dates = pd.to_datetime(df[df["Status"] == "Installed"]["Installation Date"], errors="coerce")
+days_span = (installed_dates.max() - installed_dates.min()).days or 1 if not installed_dates.empty else 0
+daily_rate = round(installed_count / days_span, 2) if days_span else 0
+
+kpi1, kpi2, kpi3, kpi4, kpi5 = st.columns(5)
+kpi1.metric("Total Sites", total_sites)
+kpi2.metric("Installed", installed_count)
+kpi3.metric("Open", open_count)
+kpi4.metric("Progress %", f"{progress}%")
+kpi5.metric("Daily Rate", f"{daily_rate} sites/day")
+
+if df["Project"].nunique() > 1:
+    st.dataframe(project_kpis(df))
+
+st.subheader("🔮 Completion Forecast")
+projection = forecast(df)
+overall = projection.loc["All"]
+fc1, fc2, fc3 = st.columns(3)
+fc1.metric("7-Day Rate", f"{overall['Rolling Rate']:.2f} sites/day")
+fc2.metric("Trend Rate", f"{overall['Trend Rate']:.2f} sites/day")
+if pd.notnull(overall["ETA"]):
+    eta_range = f"{overall['ETA Low']:%d %b}–{overall['ETA High']:%d %b}" if pd.notnull(overall["ETA High"]) else "open-ended"
+    fc3.metric("Est. Completion", f"{overall['ETA']:%d %b %Y}", eta_range, delta_color="off")
+else:
+    fc3.metric("Est. Completion", "N/A")
+st.dataframe(projection)
+
+st.markdown("---")
+
+st.subheader("📊 Installation Status Distribution")
+fig1, ax1 = plt.subplots()
+df["Status"].value_counts().plot.pie(autopct="%1.1f%%", colors=["green", "red"], ax=ax1)
+ax1.set_ylabel("")
+st.pyplot(fig1)
+
+st.subheader("📈 Daily Installation Trend")
+# Installs grouped by their own dates; the recorded history only drives the burn-down below
+trend_df = df[df["Status"] == "Installed"].copy()
+trend_df["Installation Date"] = pd.to_datetime(trend_df["Installation Date"], errors="coerce")
+trend = trend_df.groupby(trend_df["Installation Date"].dt.date).size()
+fig2, ax2 = plt.subplots()
+trend.plot(ax=ax2)
+ax2.set_ylabel("Sites Installed")
+ax2.set_xlabel("Date")
+st.pyplot(fig2)
+
+# Same projects as the sidebar picker, like the KPIs above
+history = load_history(projects=df["Project"].unique().tolist())
+if not history.empty:
+    st.subheader("📉 Progress History & Burn-down")
+    fig3, ax3 = plt.subplots()
+    history["Scope"].plot(ax=ax3, color="gray", linestyle="--")
+    history["Installed"].plot(ax=ax3, color="green")
+    history["Open"].plot(ax=ax3, color="red")
+    ax3.set_ylabel("Sites")
+    ax3.set_xlabel("Date")
+    ax3.legend()
+    st.pyplot(fig3)
+
+st.markdown("### 📥 Export Data")
+excel_data = get_excel(data["version"], df, st.session_state.get("dispatch_plan"))
+st.download_button("⬇️ Download Excel", data=excel_data, file_name="installation_status.xlsx", mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+
+df_sample_html = df[["Site ID", "Status", "Installation Date"]].to_html(index=False)
+pdf_html = f"<html><body>{df_sample_html}</body></html>"
+b64 = base64.b64encode(pdf_html.encode()).decode()
+st.markdown(f'<a href="data:text/html;base64,{b64}" download="installation_report.html">⬇️ Download PDF Report</a>', unsafe_allow_html=True)
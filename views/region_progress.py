@@ -0,0 +1,44 @@
+import folium
+import pandas as pd
+import streamlit as st
+from streamlit_folium import st_folium
+
+from engine import current, get_map_payload
+from map_payload import MAP_CENTER, CompactMarkers
+
+data = current()
+df = data["df"]
+
+# Filters
+regions = sorted(df["Region"].dropna().unique().tolist())
+selected_region = st.selectbox("Select Region", ["All"] + regions)
+installed_dates = pd.to_datetime(df["Installation Date"], errors="coerce")
+if installed_dates.notna().any():
+    date_range = st.date_input("Select Date Range", [installed_dates.min(), installed_dates.max()])
+else:
+    date_range = ()
+
+mask = pd.Series(True, index=df.index)
+if selected_region != "All":
+    mask &= df["Region"] == selected_region
+if len(date_range) == 2:
+    # Open sites stay in view; installed ones must fall inside the range
+    in_range = (installed_dates >= pd.to_datetime(date_range[0])) & (installed_dates < pd.to_datetime(date_range[1]) + pd.Timedelta(days=1))
+    mask &= installed_dates.isna() | in_range
+filtered = df[mask]
+
+# KPIs
+total_sites = len(filtered)
+installed_sites = (filtered["Status"] == "Installed").sum()
+progress = round((installed_sites / total_sites) * 100, 1) if total_sites else 0
+filtered_dates = installed_dates[mask].dropna()
+daily_rate = installed_sites / max((filtered_dates.max() - filtered_dates.min()).days, 1) if not filtered_dates.empty else 0
+
+st.markdown(f"### 📊 Total Sites: {total_sites} | ✅ Installed: {installed_sites} | 📈 Progress: {progress}% | 📅 Daily Rate: {daily_rate:.2f}/day")
+
+on_map = filtered[filtered.index.isin(data["df_map"].index)]
+m = folium.Map(location=MAP_CENTER, zoom_start=6)
+# The payload cache is keyed on the filter as well as the data version
+payload_key = (data["version"], selected_region, tuple(date_range))
+CompactMarkers(payload=get_map_payload(payload_key, on_map)).add_to(m)
+st_folium(m, height=500, returned_objects=[], use_container_width=True)
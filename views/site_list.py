@@ -0,0 +1,38 @@
+import streamlit as st
+
+from engine import current, get_sort_orders
+from site_table import FILTER_COLUMNS, PAGE_SIZES, filter_mask, get_page, table_columns
+
+data = current()
+df = data["df"]
+quarantine = data["quarantine"]
+id_suggestions = data["suggestions"]
+
+st.subheader("🗂️ Site Table")
+filter_cols = st.columns(len(FILTER_COLUMNS) + 1)
+table_filters = {
+    col: filter_cols[i].multiselect(col, sorted(df[col].dropna().unique().tolist()), key=f"table_{col}")
+    for i, col in enumerate(FILTER_COLUMNS)
+    if col in df.columns
+}
+table_search = filter_cols[-1].text_input("Site ID contains", key="table_search")
+tc1, tc2, tc3, tc4 = st.columns(4)
+sort_by = tc1.selectbox("Sort by", table_columns(df), index=table_columns(df).index("Site ID"))
+ascending = tc2.toggle("Ascending", value=True)
+page_size = tc3.selectbox("Rows per page", PAGE_SIZES)
+mask = filter_mask(df, table_filters, table_search)
+page_count = max(1, -(-int(mask.sum()) // page_size))
+page_number = tc4.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+page_rows, matching = get_page(df, get_sort_orders(data["version"], df), sort_by, ascending, mask, int(page_number), page_size)
+st.dataframe(page_rows, hide_index=True)
+first_row = (int(page_number) - 1) * page_size + 1 if matching else 0
+st.caption(f"Rows {first_row}–{min(int(page_number) * page_size, matching)} of {matching}")
+
+if not quarantine.empty:
+    st.subheader(f"🚧 Coordinate Quarantine ({len(quarantine)} sites)")
+    st.caption("Sites with On Map = False are counted in the KPIs but not drawn.")
+    st.dataframe(quarantine, hide_index=True)
+
+if not id_suggestions.empty:
+    with st.expander(f"⚠️ Form submissions not matching any project site ({len(id_suggestions)})"):
+        st.dataframe(id_suggestions, hide_index=True)
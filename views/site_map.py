@@ -0,0 +1,57 @@
+import folium
+import streamlit as st
+from streamlit_folium import st_folium
+
+from change_feed import add_new_installs_layer, describe
+from density import RESOLUTIONS, add_density_layers
+from engine import current, get_density_grids, get_map_payload, get_search_index
+from map_payload import MAP_CENTER, CompactMarkers, add_markers, payload_report
+
+data = current()
+df_map = data["df_map"]
+changes = data["changes"]
+
+st.subheader("📍 Site Installation Map")
+sc1, sc2 = st.columns(2)
+site_query = sc1.text_input("🔎 Find site by ID or name")
+found = get_search_index(data["version"], df_map).lookup(site_query)
+labels = [f"{df_map['Site ID'].iat[i]} – {df_map['Status'].iat[i]}" for i in found]
+chosen = sc2.selectbox("Matches", range(len(found)), format_func=labels.__getitem__, index=None, placeholder="Type to search")
+map_view = st.radio("Map view", ["Sites", "Density"], horizontal=True)
+m = folium.Map(location=MAP_CENTER, zoom_start=6)
+if map_view == "Density":
+    resolution = st.select_slider("Heatmap cell size", options=list(RESOLUTIONS), value="Medium (~25 km)")
+    grids = get_density_grids(data["version"], df_map)
+    add_density_layers(m, grids[resolution], RESOLUTIONS[resolution])
+elif st.toggle("Compact map payload", value=True):
+    CompactMarkers(payload=get_map_payload(data["version"], df_map)).add_to(m)
+else:
+    add_markers(m, df_map)
+if changes is not None and len(changes["installed"]):
+    add_new_installs_layer(m, df_map, changes["installed"])
+if map_view == "Density" or (changes is not None and len(changes["installed"])):
+    folium.LayerControl().add_to(m)
+# Jumping to a site only moves the view and adds one marker; the base map is not re-sent
+map_center, map_zoom, jump_layer = MAP_CENTER, 6, None
+if chosen is not None:
+    site = df_map.iloc[found[chosen]]
+    map_center, map_zoom = [site["Latitude"], site["Longitude"]], 15
+    jump_layer = folium.FeatureGroup(name="Selected site")
+    folium.Marker(
+        location=map_center,
+        popup=folium.Popup(
+            f"Site ID: {site['Site ID']}<br>Status: {site['Status']}<br>Installation Date: {site['Installation Date']}",
+            show=True,
+        ),
+    ).add_to(jump_layer)
+st_folium(m, center=map_center, zoom=map_zoom, feature_group_to_add=jump_layer, returned_objects=[], use_container_width=True)
+
+if st.checkbox("Show map payload size report"):
+    st.dataframe(payload_report(df_map))
+
+if changes is not None:
+    with st.expander(f"🔔 Changes since last refresh ({len(changes['installed'])} newly installed)"):
+        st.write(f"Newly installed: {', '.join(describe(changes['installed'])) or 'none'}")
+        st.write(f"Added to scope: {', '.join(describe(changes['added'])) or 'none'}")
+        st.write(f"Removed from scope: {', '.join(describe(changes['removed'])) or 'none'}")
+        st.write(f"Other changes: {len(changes['changed']) - len(changes['installed'])} sites")